@@ -0,0 +1,100 @@
+"""
+Build the static assets served from src/static.
+
+Resizes the dashboard banner into WebP variants at several widths (never
+upscaling), names each one by content hash and writes a manifest the app uses
+to emit a responsive <img srcset>. Fonts dropped into src/static/fonts as
+<Family>-<weight>.woff2 are renamed to <Family>-<weight>.<hash>.woff2.
+
+Usage:
+    python scripts/build_assets.py
+"""
+import hashlib
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+ROOT = Path(__file__).resolve().parent.parent
+BANNER_SOURCE = ROOT / "src" / "images" / "disney_dashboard.png"
+BANNER_OUT_DIR = ROOT / "src" / "static" / "banner"
+BANNER_WIDTHS = (360, 720, 1080, 1440)
+WEBP_QUALITY = 85
+FONTS_DIR = ROOT / "src" / "static" / "fonts"
+UNHASHED_FONT_PATTERN = re.compile(r"^[A-Za-z]+-\d{3}\.woff2$")
+
+
+def content_hash(data):
+    """
+    Return a short SHA-256 digest of some bytes, used in asset file names.
+    """
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def encode_webp(image, width):
+    """
+    Resize an image to `width` (keeping aspect ratio) and return it as WebP bytes.
+    """
+    height = max(1, round(image.height * width / image.width))
+    resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    resized.save(buffer, format='WEBP', quality=WEBP_QUALITY, method=6)
+    return buffer.getvalue(), height
+
+
+def build_banner(source=BANNER_SOURCE, out_dir=BANNER_OUT_DIR, widths=BANNER_WIDTHS):
+    """
+    Write hashed WebP variants of the banner plus manifest.json; return the manifest.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob("banner-*.webp"):
+        stale.unlink()
+
+    with Image.open(source) as image:
+        image.load()
+        # Never upscale: the source width is always the largest variant
+        targets = sorted({w for w in widths if w < image.width} | {image.width})
+        variants = []
+        for width in targets:
+            data, height = encode_webp(image, width)
+            name = f"banner-{width}.{content_hash(data)}.webp"
+            (out_dir / name).write_bytes(data)
+            variants.append({'file': name, 'width': width, 'height': height, 'bytes': len(data)})
+
+    manifest = {'source': source.relative_to(ROOT).as_posix(), 'variants': variants}
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def hash_fonts(fonts_dir=FONTS_DIR):
+    """
+    Rename <Family>-<weight>.woff2 fonts to content-hashed names; return the new paths.
+    """
+    renamed = []
+    for font_path in sorted(fonts_dir.glob("*.woff2")):
+        if not UNHASHED_FONT_PATTERN.match(font_path.name):
+            continue
+        prefix = font_path.name[:-len(".woff2")]
+        # Drop the previous build of the same face so only one version is served
+        for stale in fonts_dir.glob(f"{prefix}.*.woff2"):
+            stale.unlink()
+        hashed_path = font_path.with_name(f"{prefix}.{content_hash(font_path.read_bytes())}.woff2")
+        font_path.rename(hashed_path)
+        renamed.append(hashed_path)
+    return renamed
+
+
+def main():
+    manifest = build_banner()
+    for variant in manifest['variants']:
+        print(f"{variant['file']}: {variant['width']}x{variant['height']}, {variant['bytes']:,} bytes")
+    for font_path in hash_fonts():
+        print(f"{font_path.name}: {font_path.stat().st_size:,} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Concurrent-session load test for the Streamlit dashboard.
+
+Simulates N sessions of src/app.py with Streamlit's AppTest, each performing a
+random sequence of sidebar interactions, and reports rerun latency percentiles,
+throughput and peak RSS for several dataset scales.
+
+Usage:
+    python scripts/load_test.py --sessions 8 --interactions 25 --scales 1,10,100
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "src" / "app.py"
+DATA_PATH = ROOT / "src" / "data" / "disney_movies.csv"
+RERUN_TIMEOUT = 120
+
+
+def build_scaled_dataset(scale, out_dir):
+    """
+    Write a copy of the dataset replicated `scale` times with unique titles.
+    """
+    base = pd.read_csv(DATA_PATH)
+    if scale == 1:
+        frame = base
+    else:
+        copies = []
+        for i in range(scale):
+            copy = base.copy()
+            # Keep title/date pairs unique so replicated rows are not treated as duplicates
+            copy['movie_title'] = copy['movie_title'].astype(str) + f" #{i}"
+            copies.append(copy)
+        frame = pd.concat(copies, ignore_index=True)
+    out_path = Path(out_dir) / f"disney_movies_x{scale}.csv"
+    frame.to_csv(out_path, index=False)
+    return out_path, len(frame)
+
+
+def _widget_by_label(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def _random_interaction(at, rng):
+    """
+    Apply one realistic sidebar interaction to the AppTest and return its name.
+    """
+    action = rng.choice(['year_range', 'genre_toggle', 'rating_toggle', 'bulk_select', 'min_revenue', 'base_year'])
+    if action == 'year_range':
+        slider = _widget_by_label(at.slider, "Select Year Range")
+        lo, hi = slider.min, slider.max
+        start = rng.randint(lo, hi)
+        slider.set_value((start, rng.randint(start, hi)))
+    elif action in ('genre_toggle', 'rating_toggle'):
+        prefix = 'genre_' if action == 'genre_toggle' else 'rating_'
+        boxes = [cb for cb in at.checkbox if cb.key and cb.key.startswith(prefix)]
+        box = rng.choice(boxes)
+        box.set_value(not box.value)
+    elif action == 'bulk_select':
+        key = rng.choice(['select_all_genres', 'clear_all_genres', 'select_all_ratings', 'clear_all_ratings'])
+        at.button(key=key).click()
+    elif action == 'min_revenue':
+        selectbox = _widget_by_label(at.selectbox, "Minimum Revenue")
+        selectbox.select_index(rng.randrange(len(selectbox.options)))
+    else:
+        selectbox = _widget_by_label(at.selectbox, "Inflation Base Year")
+        selectbox.select_index(rng.randrange(len(selectbox.options)))
+    return action
+
+
+def _run_session(session_id, interactions, seed):
+    """
+    Drive one simulated user session and return its rerun latencies and error count.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed + session_id)
+    latencies = []
+    errors = 0
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=RERUN_TIMEOUT)
+    start = time.perf_counter()
+    at.run()
+    latencies.append(time.perf_counter() - start)
+    errors += len(at.exception)
+
+    for _ in range(interactions):
+        _random_interaction(at, rng)
+        start = time.perf_counter()
+        at.run()
+        latencies.append(time.perf_counter() - start)
+        errors += len(at.exception)
+
+    return latencies, errors
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_scale(data_path, sessions, interactions, seed):
+    """
+    Run all sessions concurrently against one dataset; meant to run in a fresh process.
+    """
+    # The app reads this at import time, and st.cache_data is shared across sessions
+    os.environ['DISNEY_MOVIES_DATA'] = str(data_path)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions, thread_name_prefix='session') as pool:
+        results = list(pool.map(
+            lambda sid: _run_session(sid, interactions, seed),
+            range(sessions)
+        ))
+    wall_time = time.perf_counter() - wall_start
+
+    latencies = np.array([lat for session_latencies, _ in results for lat in session_latencies])
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {
+        'reruns': int(latencies.size),
+        'errors': sum(errors for _, errors in results),
+        'p50_ms': p50,
+        'p95_ms': p95,
+        'p99_ms': p99,
+        'max_ms': latencies.max() * 1000,
+        'throughput': latencies.size / wall_time,
+        'wall_s': wall_time,
+        'peak_rss_mb': _peak_rss_mb()
+    }
+
+
+def format_report(rows):
+    """
+    Render the per-scale results as a fixed-width table.
+    """
+    header = f"{'scale':>6} {'rows':>10} {'reruns':>7} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'reruns/s':>9} {'peak RSS MB':>12}"
+    lines = [header, '-' * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['scale']:>6} {row['rows']:>10,} {row['reruns']:>7} {row['errors']:>6} "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f} "
+            f"{row['throughput']:>9.2f} {row['peak_rss_mb']:>12.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=8, help='concurrent sessions per scale')
+    parser.add_argument('--interactions', type=int, default=25, help='sidebar interactions per session')
+    parser.add_argument('--scales', default='1,10,100', help='comma-separated dataset replication factors')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the interaction sequences')
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) for scale in args.scales.split(',')]
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            data_path, n_rows = build_scaled_dataset(scale, tmp_dir)
+            print(f"Running scale x{scale} ({n_rows:,} rows, {args.sessions} sessions)...", flush=True)
+            # A fresh process per scale keeps caches and peak RSS from leaking between runs
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                result = pool.submit(run_scale, data_path, args.sessions, args.interactions, args.seed).result()
+            rows.append({'scale': scale, 'rows': n_rows, **result})
+
+    print()
+    print(format_report(rows))
+    return 1 if any(row['errors'] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,10 +1,10 @@
 import streamlit as st
 import pandas as pd
+import os
 import sys
 from pathlib import Path
 import numpy as np
 import altair as alt
-from PIL import Image
 
 # Add the src directory to Python path
 src_path = str(Path(__file__).parent.parent)
@@ -19,6 +19,12 @@ from src.utils.data_processor import (
     get_rating_distribution,
     get_seasonal_analysis
 )
+from src.utils.inflation import (
+    load_cpi_table,
+    get_cpi_years,
+    get_adjustment_factors,
+    apply_adjustment_factors
+)
 from src.visualizations.chart_configs import (
     create_time_series_line_chart,
     create_genre_chart,
@@ -26,18 +32,51 @@ from src.visualizations.chart_configs import (
     create_seasonal_heatmap
 )
 from src.styles.custom_theme import apply_custom_theme, get_color_palette
+from src.utils.static_assets import get_banner_html
 
 # Apply custom theme
 apply_custom_theme()
 COLORS = get_color_palette()
 
 # Load and process data
-DATA_PATH = Path(__file__).parent / "data" / "disney_movies.csv"
+# DISNEY_MOVIES_DATA lets the load test point the app at a scaled-up dataset
+DATA_PATH = Path(os.environ.get("DISNEY_MOVIES_DATA", Path(__file__).parent / "data" / "disney_movies.csv"))
 @st.cache_data
 def load_data():
-    return load_and_process_data(DATA_PATH)
+    return load_and_process_data(DATA_PATH, return_report=True)
+
+CPI_PATH = Path(__file__).parent / "data" / "cpi_u_annual.csv"
+@st.cache_data
+def load_cpi():
+    return load_cpi_table(CPI_PATH)
+
+# Only the small per-year factor vector is cached per base year; applying it to
+# the loaded frame is a single gather-and-multiply, cheaper than caching frames
+@st.cache_data
+def load_adjustment_factors(base_year):
+    return get_adjustment_factors(load_cpi(), base_year)
+
+def render_quality_report(report):
+    st.caption(f"{report['valid_rows']:,} of {report['total_rows']:,} rows passed validation.")
+    for issue, count in report['issue_counts'].items():
+        if count:
+            st.markdown(f"- {issue.replace('_', ' ').capitalize()}: {count:,}")
+    for column, count in report['coerced_counts'].items():
+        if count:
+            st.markdown(f"- Unparseable {column.replace('_', ' ')} (kept, set to NaN): {count:,}")
+    if report['quarantined_rows']:
+        # Cap the preview so a badly broken file doesn't ship millions of rows to the browser
+        st.dataframe(report['quarantine'].head(1000), use_container_width=True)
+
+df, quality_report = load_data()
 
-df = load_data()
+# Nothing below can render without data, so explain why every row was rejected
+if df.empty:
+    st.error("No rows passed validation, so there is nothing to display.")
+    render_quality_report(quality_report)
+    st.stop()
+
+cpi_table = load_cpi()
 summary_stats = get_summary_statistics(df)
 
 # Compute revenue quartiles for dropdown
@@ -106,6 +145,15 @@ with st.sidebar:
         index=0
     )
     min_revenue = next(val for val, label in revenue_options if label == min_revenue_label)
+
+    base_year = st.selectbox(
+        "Inflation Base Year",
+        options=get_cpi_years(cpi_table),
+        index=0
+    )
+
+    with st.expander(f"Data Quality ({quality_report['quarantined_rows']:,} rows excluded)"):
+        render_quality_report(quality_report)
     st.markdown("---")
     st.markdown(
         "<div style='text-align: center; padding-top: 1rem;'>"
@@ -129,6 +177,7 @@ def filter_df(df):
     ]
     return filtered
 
+df = apply_adjustment_factors(df, load_adjustment_factors(base_year), cpi_table['first_year'])
 filtered_df = filter_df(df)
 
 # Use filtered_df for all downstream calculations and visualizations
@@ -136,11 +185,14 @@ summary_stats = get_summary_statistics(filtered_df)
 
 # --- BANNER ---
 with st.container():
-    try:
-        image_path = Path(__file__).parent / "images" / "disney_dashboard.png"
-        image = Image.open(image_path)
-        st.image(image, use_container_width=True)
-    except FileNotFoundError:
+    # Prefer the prebuilt, cacheable WebP variants from scripts/build_assets.py
+    banner_html = get_banner_html("Disney Movies Dashboard")
+    image_path = Path(__file__).parent / "images" / "disney_dashboard.png"
+    if banner_html:
+        st.markdown(banner_html, unsafe_allow_html=True)
+    elif image_path.exists():
+        st.image(str(image_path), use_container_width=True)
+    else:
         st.info("To add a banner, place an image named `disney_dashboard.png` in the `src/images` directory.")
 
 # --- TOP STATS ---
@@ -284,10 +336,20 @@ with st.container():
     with col1:
         st.markdown("**Top 20 Movies**")
         top_movies = filtered_df.sort_values('total_gross', ascending=False).head(20)
-        st.dataframe(top_movies[['movie_title', 'year', 'genre', 'total_gross']].style.format({'total_gross': '${:,.0f}'}), use_container_width=True)
+        st.dataframe(
+            top_movies[['movie_title', 'year', 'genre', 'total_gross', 'inflation_adjusted_gross']]
+            .rename(columns={'inflation_adjusted_gross': f'adjusted_gross_{base_year}'})
+            .style.format({'total_gross': '${:,.0f}', f'adjusted_gross_{base_year}': '${:,.0f}'}),
+            use_container_width=True
+        )
     with col2:
         st.markdown("**Bottom 20 Movies**")
         bottom_movies = filtered_df.sort_values('total_gross', ascending=True).head(20)
-        st.dataframe(bottom_movies[['movie_title', 'year', 'genre', 'total_gross']].style.format({'total_gross': '${:,.0f}'}), use_container_width=True)
+        st.dataframe(
+            bottom_movies[['movie_title', 'year', 'genre', 'total_gross', 'inflation_adjusted_gross']]
+            .rename(columns={'inflation_adjusted_gross': f'adjusted_gross_{base_year}'})
+            .style.format({'total_gross': '${:,.0f}', f'adjusted_gross_{base_year}': '${:,.0f}'}),
+            use_container_width=True
+        )
 
 st.markdown("---") 
\ No newline at end of file
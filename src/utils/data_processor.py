@@ -2,50 +2,112 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
-def load_and_process_data(file_path):
+VALID_MPAA_RATINGS = ['G', 'PG', 'PG-13', 'R', 'NC-17', 'Not Rated']
+EARLIEST_RELEASE_DATE = pd.Timestamp('1900-01-01')
+SEASONS_BY_MONTH = np.array([
+    'Winter', 'Winter', 'Spring', 'Spring', 'Spring', 'Summer',
+    'Summer', 'Summer', 'Fall', 'Fall', 'Fall', 'Winter'
+])
+
+def validate_movies(df):
+    """
+    Coerce raw columns and split rows into valid and quarantined sets.
+
+    Every check is a whole-column mask, so validation costs a handful of
+    vectorized passes regardless of how many rows fail. Unparseable
+    inflation_adjusted_gross values are counted but do not quarantine a row,
+    since that column is recomputed from CPI downstream.
+    """
+    # Fast ISO parse first; retry only the misses with pandas' per-value format inference
+    release_date = pd.to_datetime(df['release_date'], errors='coerce', format='ISO8601')
+    retry = release_date.isna() & df['release_date'].notna()
+    if retry.any():
+        release_date[retry] = pd.to_datetime(df.loc[retry, 'release_date'], errors='coerce', format='mixed')
+    total_gross = pd.to_numeric(df['total_gross'], errors='coerce')
+    inflation_adjusted_gross = pd.to_numeric(df['inflation_adjusted_gross'], errors='coerce')
+    mpaa_rating = df['mpaa_rating'].fillna('Not Rated')
+
+    checks = {
+        'unparseable_release_date': release_date.isna(),
+        'release_date_out_of_range': (release_date < EARLIEST_RELEASE_DATE) | (release_date > pd.Timestamp.today()),
+        'invalid_total_gross': total_gross.isna(),
+        'non_positive_gross': total_gross <= 0,
+        'duplicate_title_and_date': pd.DataFrame({
+            'movie_title': df['movie_title'],
+            'release_date': release_date
+        }).duplicated(keep='first'),
+        'unknown_mpaa_rating': ~mpaa_rating.isin(VALID_MPAA_RATINGS)
+    }
+    failed = np.logical_or.reduce([mask.to_numpy() for mask in checks.values()])
+
+    # Label each quarantined row with the checks it failed: encode the failed
+    # checks as a bitmask and build one label per distinct combination
+    quarantine = df[failed].copy()
+    names = list(checks)
+    codes = np.column_stack([mask.to_numpy()[failed] for mask in checks.values()]) @ (1 << np.arange(len(names)))
+    labels = {
+        code: ', '.join(name for bit, name in enumerate(names) if code >> bit & 1)
+        for code in np.unique(codes)
+    }
+    quarantine['issues'] = pd.Series(codes, index=quarantine.index).map(labels)
+
+    valid = df[~failed].assign(
+        release_date=release_date[~failed],
+        total_gross=total_gross[~failed],
+        inflation_adjusted_gross=inflation_adjusted_gross[~failed],
+        mpaa_rating=mpaa_rating[~failed]
+    )
+    report = {
+        'total_rows': len(df),
+        'valid_rows': len(valid),
+        'quarantined_rows': len(quarantine),
+        'issue_counts': {name: int(mask.sum()) for name, mask in checks.items()},
+        'coerced_counts': {
+            'inflation_adjusted_gross': int((inflation_adjusted_gross.isna() & df['inflation_adjusted_gross'].notna()).sum())
+        },
+        'quarantine': quarantine
+    }
+    return valid, report
+
+def load_and_process_data(file_path, return_report=False):
     """
     Load and process the Disney movies dataset with necessary transformations.
+
+    Rows failing validation are left out of the returned frame; pass
+    return_report=True to also get the quality report from validate_movies.
     """
     # Read the CSV file
     df = pd.read_csv(file_path)
     
-    # Convert release_date to datetime
-    df['release_date'] = pd.to_datetime(df['release_date'])
+    # Coerce types and drop rows that fail validation
+    df, report = validate_movies(df)
     
     # Extract temporal features
     df['year'] = df['release_date'].dt.year
     df['month'] = df['release_date'].dt.month
     df['decade'] = (df['year'] // 10) * 10
     
-    # Convert monetary columns to numeric, handling any non-numeric values
-    df['total_gross'] = pd.to_numeric(df['total_gross'], errors='coerce')
-    df['inflation_adjusted_gross'] = pd.to_numeric(df['inflation_adjusted_gross'], errors='coerce')
-    
-    # Calculate performance metrics
+    # Calculate performance metrics (gross is always positive after validation)
     df['performance_ratio'] = df['inflation_adjusted_gross'] / df['total_gross']
     
     # Handle missing values
     df['genre'] = df['genre'].fillna('Unknown')
-    df['mpaa_rating'] = df['mpaa_rating'].fillna('Not Rated')
     
     # Create success metrics
     avg_gross = df['total_gross'].mean()
     df['success_level'] = np.where(df['total_gross'] > avg_gross, 'Above Average', 'Below Average')
     
     # Create season feature
-    df['season'] = df['month'].apply(lambda x: 
-        'Winter' if x in [12, 1, 2] else
-        'Spring' if x in [3, 4, 5] else
-        'Summer' if x in [6, 7, 8] else
-        'Fall'
-    )
+    df['season'] = SEASONS_BY_MONTH[df['month'].to_numpy() - 1]
     
     # Create decade ranges for better visualization
-    df['decade_range'] = df['decade'].apply(lambda x: f"{x}-{x+9}")
+    df['decade_range'] = df['decade'].astype(str) + '-' + (df['decade'] + 9).astype(str)
     
     # Calculate year-over-year growth
     df['yoy_growth'] = df.groupby('year')['total_gross'].pct_change() * 100
     
+    if return_report:
+        return df, report
     return df
 
 def get_summary_statistics(df):
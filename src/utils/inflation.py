@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+def load_cpi_table(file_path):
+    """
+    Load an annual CPI table (year, cpi) into a dense lookup keyed by year offset.
+    """
+    cpi = pd.read_csv(file_path, usecols=['year', 'cpi']).dropna()
+    years = cpi['year'].to_numpy(dtype=np.int64)
+    first_year = int(years.min())
+    last_year = int(years.max())
+
+    # Dense array indexed by (year - first_year); years missing from the table stay NaN
+    values = np.full(last_year - first_year + 1, np.nan)
+    values[years - first_year] = cpi['cpi'].to_numpy(dtype=float)
+
+    return {
+        'first_year': first_year,
+        'last_year': last_year,
+        'values': values
+    }
+
+def get_cpi_years(cpi_table):
+    """
+    Return the years that have a CPI value, newest first.
+    """
+    offsets = np.flatnonzero(~np.isnan(cpi_table['values']))
+    return [int(cpi_table['first_year'] + offset) for offset in offsets[::-1]]
+
+def get_adjustment_factors(cpi_table, base_year):
+    """
+    Return, for every year in the table, the multiplier into base_year dollars.
+    """
+    offset = base_year - cpi_table['first_year']
+    if not 0 <= offset < len(cpi_table['values']) or np.isnan(cpi_table['values'][offset]):
+        raise ValueError(f"No CPI value for base year {base_year}")
+    return cpi_table['values'][offset] / cpi_table['values']
+
+def apply_adjustment_factors(df, factors, first_year):
+    """
+    Gather one factor per row by year and recompute adjusted gross and performance_ratio.
+    """
+    # Years outside the factor table get NaN
+    offsets = df['year'].to_numpy(dtype=float) - first_year
+    in_table = (offsets >= 0) & (offsets < len(factors))
+    row_factors = np.where(in_table, factors[np.where(in_table, offsets, 0).astype(np.intp)], np.nan)
+
+    total_gross = df['total_gross'].to_numpy(dtype=float)
+    adjusted_gross = total_gross * row_factors
+
+    # Shallow copy: only the two recomputed columns get new arrays
+    adjusted = df.copy(deep=False)
+    adjusted['inflation_adjusted_gross'] = adjusted_gross
+    adjusted['performance_ratio'] = adjusted_gross / total_gross
+    return adjusted
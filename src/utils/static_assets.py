@@ -0,0 +1,69 @@
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+# Streamlit serves <app dir>/static at app/static when server.enableStaticServing is on
+STATIC_DIR = Path(__file__).parent.parent / "static"
+STATIC_URL = "app/static"
+FONTS_DIR = STATIC_DIR / "fonts"
+BANNER_MANIFEST_PATH = STATIC_DIR / "banner" / "manifest.json"
+# Fonts are content-hash named by scripts/build_assets.py: <Family>-<weight>.<hash>.woff2
+FONT_FILE_PATTERN = re.compile(r"^(?P<family>[A-Za-z]+)-(?P<weight>\d{3})\.[0-9a-f]+\.woff2$")
+
+def get_static_url(relative_path):
+    """
+    Return the URL of a file under src/static.
+
+    Static assets carry a content hash in their file name, so the URL changes
+    whenever the file does and any caching of it is safe. How long browsers
+    keep it depends on the Streamlit server; recent releases send
+    ETag/Last-Modified but no Cache-Control for app/static.
+    """
+    return f"{STATIC_URL}/{relative_path}"
+
+@lru_cache(maxsize=1)
+def get_font_face_css():
+    """
+    Build @font-face rules for the bundled, hash-named woff2 fonts.
+    """
+    rules = []
+    for font_path in sorted(FONTS_DIR.glob("*.woff2")):
+        match = FONT_FILE_PATTERN.match(font_path.name)
+        if not match:
+            continue
+        url = get_static_url(f"fonts/{font_path.name}")
+        rules.append(
+            f"@font-face{{font-family:'{match['family']}';font-style:normal;"
+            f"font-weight:{match['weight']};font-display:swap;"
+            f"src:url('{url}') format('woff2');}}"
+        )
+    return ''.join(rules)
+
+@lru_cache(maxsize=1)
+def load_banner_manifest():
+    """
+    Return the banner variants written by scripts/build_assets.py, smallest first.
+    """
+    if not BANNER_MANIFEST_PATH.exists():
+        return []
+    manifest = json.loads(BANNER_MANIFEST_PATH.read_text(encoding="utf-8"))
+    return sorted(manifest['variants'], key=lambda variant: variant['width'])
+
+def get_banner_html(alt_text):
+    """
+    Return a responsive <img> tag for the prebuilt banner variants, or None if none exist.
+    """
+    variants = load_banner_manifest()
+    if not variants:
+        return None
+    srcset = ', '.join(
+        f"{get_static_url('banner/' + variant['file'])} {variant['width']}w"
+        for variant in variants
+    )
+    largest = variants[-1]
+    return (
+        f"<img src=\"{get_static_url('banner/' + largest['file'])}\" srcset=\"{srcset}\" sizes=\"100vw\" "
+        f"width=\"{largest['width']}\" height=\"{largest['height']}\" alt=\"{alt_text}\" "
+        "decoding=\"async\" style=\"width: 100%; height: auto;\">"
+    )